@@ -13,13 +13,111 @@ cognitive components, enabling:
 - ESN temporal predictions anchored in fabric state
 """
 
+from collections import deque
 from typing import Dict, List, Any, Optional, Tuple
+import functools
 import numpy as np
 
 try:
-    from .neural_fabric import NeuralFabric, SkinScale, _cosine_similarity
+    from .neural_fabric import NeuralFabric, SkinScale, EPS, select_top_k
 except ImportError:
-    from neural_fabric import NeuralFabric, SkinScale, _cosine_similarity
+    from neural_fabric import NeuralFabric, SkinScale, EPS, select_top_k
+
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+try:
+    import simsimd
+    HAVE_SIMSIMD = True
+except ImportError:
+    HAVE_SIMSIMD = False
+
+
+def _make_pln_kernel(d: int):
+    """
+    Build the fused PLN kernel for a fixed embedding dimension.
+    
+    The kernel computes premise row norms, the premise mean, its cosine to the
+    conclusion and the mean pairwise premise cosine in explicit loops, without
+    intermediate arrays beyond the mean vector. ``d`` is captured as a
+    constant, so numba compiles every inner loop with a known trip count that
+    LLVM can fully unroll and vectorize.
+    
+    Args:
+        d: Embedding dimension the kernel is specialized for
+        
+    Returns:
+        Kernel taking (P, c) with P of shape (k, d) and c of shape (d,), and
+        returning (truth_value, premise_consistency), both in [0, 1]
+    """
+    def _pln_kernel(P: np.ndarray, c: np.ndarray) -> Tuple[float, float]:
+        k = P.shape[0]
+        
+        norms = np.empty(k)
+        mean = np.zeros(d)
+        for i in range(k):
+            acc = 0.0
+            for j in range(d):
+                v = P[i, j]
+                acc += v * v
+                mean[j] += v
+            norms[i] = np.sqrt(acc)
+        
+        dot = 0.0
+        mean_sq = 0.0
+        c_sq = 0.0
+        for j in range(d):
+            m = mean[j] / k
+            dot += m * c[j]
+            mean_sq += m * m
+            c_sq += c[j] * c[j]
+        mean_norm = np.sqrt(mean_sq)
+        c_norm = np.sqrt(c_sq)
+        truth = dot / max(mean_norm * c_norm, EPS)
+        
+        if k < 2:
+            return (truth + 1.0) * 0.5, 1.0
+        
+        total = 0.0
+        for a in range(k):
+            for b in range(a + 1, k):
+                acc = 0.0
+                for j in range(d):
+                    acc += P[a, j] * P[b, j]
+                total += (acc / max(norms[a] * norms[b], EPS) + 1.0) * 0.5
+        
+        return (truth + 1.0) * 0.5, total / (k * (k - 1) / 2)
+    
+    return _pln_kernel
+
+
+@functools.lru_cache(maxsize=None)
+def _get_pln_kernel(d: int):
+    """
+    Compiled PLN kernel specialized for dimension ``d``, or None without numba.
+    """
+    if not HAVE_NUMBA:
+        return None
+    return njit(fastmath=True)(_make_pln_kernel(d))
+
+
+def _simsimd_similarities(queries: np.ndarray, corpus: np.ndarray) -> np.ndarray:
+    """
+    Cosine similarities of each query row against a corpus using SimSIMD's
+    SIMD kernels.
+    
+    Args:
+        queries: Query matrix of shape (Q, D)
+        corpus: Corpus matrix of shape (N, D)
+        
+    Returns:
+        Similarity matrix of shape (Q, N)
+    """
+    queries = np.ascontiguousarray(queries, dtype=corpus.dtype)
+    return 1.0 - np.asarray(simsimd.cdist(queries, corpus, metric='cosine'))
 
 
 class FabricIntegrationLayer:
@@ -36,6 +134,25 @@ class FabricIntegrationLayer:
         """
         self.fabric = fabric
         self._initialize_integrations()
+        
+        # Memoized PLN inference, keyed on the component IDs the query
+        # concepts resolve to and the embedding version it was computed against
+        self._pln_inference_cached = functools.lru_cache(maxsize=4096)(
+            self._pln_inference
+        )
+        
+        # Normalized ESN recency weights, keyed by history length
+        self._esn_weight_cache: Dict[int, np.ndarray] = {}
+        
+        # Component ID allocator for AtomSpace concepts: released IDs are
+        # reused first, otherwise the next_id watermark is advanced, and a
+        # bitmap answers "is this ID in use" without hashing. Kept off the
+        # integration config so the fabric stays JSON-serializable. The
+        # snapshot is the mapping the allocator state reflects; any other
+        # change to the live mapping (load_fabric, another layer on the same
+        # fabric, a direct edit) triggers a rebuild from it.
+        self._allocator_snapshot: Optional[Dict[str, int]] = None
+        self._sync_allocator()
     
     def _initialize_integrations(self):
         """Initialize integration configurations for each cognitive system."""
@@ -45,6 +162,7 @@ class FabricIntegrationLayer:
             'type': 'knowledge_graph',
             'embedding_scale': SkinScale.TISSUE,  # Primary scale for knowledge
             'concept_mapping': {},  # Maps concept names to component IDs
+            'concept_scales': {},  # Maps concept names to their embedding scale
             'relation_encoding': 'cross_scale'  # How relations are encoded
         })
         
@@ -79,6 +197,43 @@ class FabricIntegrationLayer:
             'allocation_scales': SkinScale.ALL_SCALES
         })
     
+    def _scale_layout(self) -> Tuple[List[Tuple[str, int, int]], int]:
+        """
+        (scale, num_components, offset) of each scale in a concatenated
+        all-scale component vector, plus its total length, for vectorized
+        attention allocation. Read from the fabric on every call so it
+        follows reloads that change component counts.
+        """
+        layout = []
+        offset = 0
+        for scale in SkinScale.ALL_SCALES:
+            num_components = self.fabric.scale_embeddings[scale].num_components
+            layout.append((scale, num_components, offset))
+            offset += num_components
+        return layout, offset
+    
+    def _sync_allocator(self):
+        """
+        Rebuild the component ID allocator if the concept mapping changed.
+        
+        The live mapping is compared with the allocator's snapshot by value
+        (a C-level dict comparison), so IDs handed out afterwards are never
+        already mapping values, whoever changed the mapping.
+        """
+        concept_mapping = self.fabric.cognitive_integrations['atomspace']['concept_mapping']
+        if concept_mapping == self._allocator_snapshot:
+            return
+        
+        size = max(emb.num_components for emb in self.fabric.scale_embeddings.values())
+        if concept_mapping:
+            size = max(size, max(concept_mapping.values()) + 1)
+        self._used_ids = np.zeros(size, dtype=bool)
+        self._used_ids[list(concept_mapping.values())] = True
+        
+        self._next_id = max(concept_mapping.values()) + 1 if concept_mapping else 0
+        self._free_ids = deque(np.flatnonzero(~self._used_ids[:self._next_id]).tolist())
+        self._allocator_snapshot = dict(concept_mapping)
+    
     def atomspace_to_fabric(self, concept_name: str, 
                            concept_features: Optional[np.ndarray] = None,
                            scale: str = SkinScale.TISSUE) -> int:
@@ -101,18 +256,34 @@ class FabricIntegrationLayer:
         
         # Allocate new component
         scale_emb = self.fabric.scale_embeddings[scale]
+        self._sync_allocator()
         
-        # Find unused component or use next available
-        existing_ids = set(config['concept_mapping'].values())
-        component_id = 0
-        while component_id in existing_ids and component_id < scale_emb.num_components:
-            component_id += 1
-        
-        if component_id >= scale_emb.num_components:
-            raise ValueError(f"No available components at scale {scale}")
+        # Reuse a released component or take the next one past the watermark
+        from_free_list = bool(self._free_ids)
+        component_id = self._free_ids[0] if from_free_list else self._next_id
         
-        # Store mapping
+        if component_id < scale_emb.num_components:
+            if from_free_list:
+                self._free_ids.popleft()
+            else:
+                self._next_id += 1
+        else:
+            # The candidate is out of range for this (smaller) scale; fall back
+            # to the lowest unused ID that fits
+            component_id = int(np.argmin(self._used_ids[:scale_emb.num_components]))
+            if self._used_ids[component_id]:
+                raise ValueError(f"No available components at scale {scale}")
+            if component_id == self._next_id:
+                self._next_id += 1
+            else:
+                self._free_ids.remove(component_id)
+        
+        self._used_ids[component_id] = True
+        
+        # Store mapping, and the scale so the concept can be released later
         config['concept_mapping'][concept_name] = component_id
+        config.setdefault('concept_scales', {})[concept_name] = scale
+        self._allocator_snapshot[concept_name] = component_id
         
         # Set metadata
         scale_emb.set_metadata(component_id, {
@@ -121,13 +292,150 @@ class FabricIntegrationLayer:
             'type': 'knowledge_concept'
         })
         
-        # Initialize embedding with features if provided
+        # Initialize embedding with features if provided, stored unit-length
+        # so cosine similarity against it reduces to a dot product
         if concept_features is not None:
             if len(concept_features) == self.fabric.embedding_dimension:
-                scale_emb.embeddings[component_id] = concept_features
+                concept_features = np.asarray(concept_features, dtype=np.float32)
+                scale_emb.set_embedding(
+                    component_id,
+                    concept_features / (np.linalg.norm(concept_features) or 1)
+                )
         
         return component_id
     
+    def release_concept(self, concept_name: str,
+                        scale: Optional[str] = None) -> Optional[int]:
+        """
+        Remove an AtomSpace concept from the fabric, freeing its component.
+        
+        Args:
+            concept_name: Name of the concept
+            scale: Scale at which the concept was embedded; only used for
+                mappings that predate per-concept scale records
+            
+        Returns:
+            The released component ID, or None if the concept was not mapped
+        """
+        self._sync_allocator()
+        config = self.fabric.cognitive_integrations['atomspace']
+        component_id = config['concept_mapping'].pop(concept_name, None)
+        if component_id is None:
+            return None
+        
+        recorded_scale = config.get('concept_scales', {}).pop(concept_name, None)
+        scale_emb = self.fabric.scale_embeddings[recorded_scale or scale or SkinScale.TISSUE]
+        # Only clear metadata this concept owns
+        if scale_emb.get_metadata(component_id).get('concept_name') == concept_name:
+            scale_emb.clear_metadata(component_id)
+        self._free_ids.append(component_id)
+        self._used_ids[component_id] = False
+        del self._allocator_snapshot[concept_name]
+        
+        return component_id
+    
+    def _emb(self, scale: str, component_id: int) -> np.ndarray:
+        """
+        Zero-copy view of a component embedding for internal hot paths.
+        
+        Unlike NeuralFabric.get_embedding this neither validates the ID nor
+        copies the row, so callers must treat the view as read-only and
+        range-check the ID first. Concept-mapping IDs are global across
+        scales, so they are not necessarily valid at a given scale.
+        """
+        return self.fabric.scale_embeddings[scale].embeddings[component_id]
+    
+    def _query_scale(self, scale: str, queries: np.ndarray):
+        """Return the embedding store for a query, validating scale and query dimension."""
+        if scale not in self.fabric.scale_embeddings:
+            raise ValueError(f"Unknown scale: {scale}")
+        scale_emb = self.fabric.scale_embeddings[scale]
+        if np.shape(queries)[-1:] != (scale_emb.dimension,):
+            raise ValueError(
+                f"Query shape {np.shape(queries)} does not match embedding "
+                f"dimension {scale_emb.dimension}"
+            )
+        return scale_emb
+    
+    def _tiled_cosine_topk(self, query: np.ndarray, scale: str, k: int,
+                           tile: int = 64) -> List[Tuple[int, float]]:
+        """
+        Find the k components most similar to a query at a scale.
+        
+        The embedding matrix is scanned in row panels of ``tile`` rows so each
+        panel @ query product stays cache resident. Each panel is cut down to
+        its own top-k, and the panel candidates are merged with a final
+        top-k; both steps go through select_top_k, so the result follows the
+        same rules as every other search. Panels are read from the unit-length
+        rows, so each similarity is a plain dot product.
+        """
+        scale_emb = self._query_scale(scale, query)
+        query_norm = np.linalg.norm(query)
+        if query_norm < 1e-10 or k <= 0:
+            return []
+        
+        unit_embeddings = scale_emb.unit_embeddings
+        query_unit = (query / query_norm).astype(unit_embeddings.dtype, copy=False)
+        
+        candidate_ids = []
+        candidate_sims = []
+        for start in range(0, scale_emb.num_components, tile):
+            part = unit_embeddings[start:start + tile] @ query_unit
+            ids, sims = select_top_k(part, k, ids=np.arange(start, start + len(part)))
+            candidate_ids.append(ids)
+            candidate_sims.append(sims)
+        
+        ids, sims = select_top_k(np.concatenate(candidate_sims), k,
+                                 ids=np.concatenate(candidate_ids))
+        matched = ids >= 0
+        return list(zip(ids[matched].tolist(), sims[matched].tolist()))
+    
+    def _cosine_topk(self, query: np.ndarray, scale: str,
+                     k: int) -> List[Tuple[int, float]]:
+        """
+        Top-k similarity search, through SimSIMD when it is installed and the
+        tiled NumPy scan otherwise. Returns the same (component_id,
+        similarity) list as NeuralFabric.query_fabric.
+        """
+        if not HAVE_SIMSIMD:
+            return self._tiled_cosine_topk(query, scale, k)
+        
+        scale_emb = self._query_scale(scale, query)
+        if np.linalg.norm(query) < 1e-10 or k <= 0:
+            return []
+        ids, sims = select_top_k(
+            _simsimd_similarities(np.asarray(query)[None, :], scale_emb.embeddings)[0], k
+        )
+        matched = ids >= 0
+        return list(zip(ids[matched].tolist(), sims[matched].tolist()))
+    
+    def batch_query(self, queries: np.ndarray, scale: str,
+                    top_k: int = 5) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Query the fabric with several embeddings at once.
+        
+        All cosine similarities are computed with one (Q, D) @ (D, N) matrix
+        product, then each row's top-k is chosen by select_top_k, the same
+        rule set as query_fabric.
+        
+        Args:
+            queries: Query embeddings of shape (Q, D)
+            scale: Scale to query
+            top_k: Number of top matches to return per query
+            
+        Returns:
+            Tuple of (component_ids, similarities), each of shape
+            (Q, min(top_k, N)) with rows sorted by descending similarity;
+            rows with fewer matches are padded with ID -1
+        """
+        queries = np.atleast_2d(queries)
+        scale_emb = self._query_scale(scale, queries)
+        
+        query_norms = np.linalg.norm(queries, axis=1, keepdims=True)
+        scores = (queries / np.maximum(query_norms, EPS)) @ scale_emb.unit_embeddings.T
+        
+        return select_top_k(scores, top_k)
+    
     def fabric_to_atomspace(self, component_id: int, 
                            scale: str = SkinScale.TISSUE) -> Dict[str, Any]:
         """
@@ -140,22 +448,31 @@ class FabricIntegrationLayer:
         Returns:
             Dictionary with concept information
         """
-        embedding = self.fabric.get_embedding(scale, component_id)
-        metadata = self.fabric.scale_embeddings[scale].get_metadata(component_id)
+        if scale not in self.fabric.scale_embeddings:
+            raise ValueError(f"Unknown scale: {scale}")
+        
+        # Range-checked view of the row; it is copied into the result below
+        scale_emb = self.fabric.scale_embeddings[scale]
+        embedding = scale_emb._row_view(component_id)
+        metadata = scale_emb.get_metadata(component_id)
         
         # Find related concepts through similarity
-        similar_components = self.fabric.query_fabric(embedding, scale, top_k=5)
+        similar_components = [
+            (comp_id, sim)
+            for comp_id, sim in self._cosine_topk(embedding, scale, k=5)
+            if comp_id != component_id
+        ]
         
         return {
-            'embedding': embedding,
+            'embedding': embedding.copy(),
             'metadata': metadata,
             'similar_concepts': [
                 {
                     'component_id': comp_id,
                     'similarity': sim,
-                    'metadata': self.fabric.scale_embeddings[scale].get_metadata(comp_id)
+                    'metadata': scale_emb.get_metadata(comp_id)
                 }
-                for comp_id, sim in similar_components if comp_id != component_id
+                for comp_id, sim in similar_components
             ]
         }
     
@@ -173,55 +490,93 @@ class FabricIntegrationLayer:
         Returns:
             Dictionary with truth value and confidence
         """
-        config = self.fabric.cognitive_integrations['pln']
         concept_mapping = self.fabric.cognitive_integrations['atomspace']['concept_mapping']
         
-        # Get embeddings for premises
-        premise_embeddings = []
-        for concept in premise_concepts:
-            if concept in concept_mapping:
-                comp_id = concept_mapping[concept]
-                premise_embeddings.append(self.fabric.get_embedding(scale, comp_id))
-        
-        if not premise_embeddings:
+        # Key the cache on the component IDs the concepts resolve to right
+        # now, so it follows the live mapping whoever changes it. Premise
+        # order does not affect the result, so sort for a canonical key.
+        premise_ids = tuple(sorted(
+            comp_id for comp_id in (concept_mapping.get(c) for c in premise_concepts)
+            if comp_id is not None
+        ))
+        result = self._pln_inference_cached(
+            premise_ids, concept_mapping.get(conclusion_concept), scale,
+            self.fabric.scale_embeddings[scale].version
+        )
+        return dict(result)
+    
+    def _pln_inference(self, premise_ids: Tuple[int, ...],
+                       conclusion_id: Optional[int], scale: str,
+                       embedding_version: int) -> Dict[str, float]:
+        """
+        Uncached PLN inference on resolved component IDs; the embedding
+        version argument only keys the cache.
+        """
+        if not premise_ids or conclusion_id is None:
             return {'truth_value': 0.0, 'confidence': 0.0}
         
-        # Combine premises (simple average)
-        combined_premise = np.mean(premise_embeddings, axis=0)
+        scale_emb = self.fabric.scale_embeddings[scale]
+        premise_ids = np.fromiter(premise_ids, dtype=np.intp, count=len(premise_ids))
+        
+        # Mapping IDs are global across scales; check they fit this one
+        scale_emb._check_ids(premise_ids)
+        scale_emb._check_ids(conclusion_id)
         
         # Get conclusion embedding
-        if conclusion_concept in concept_mapping:
-            conclusion_id = concept_mapping[conclusion_concept]
-            conclusion_emb = self.fabric.get_embedding(scale, conclusion_id)
+        conclusion_emb = self._emb(scale, conclusion_id)
+        
+        # Gather premises into one fresh contiguous matrix so averaging and
+        # consistency share it
+        P = scale_emb.embeddings[premise_ids].astype(np.float32, copy=False)
+        num_premises = len(P)
+        
+        # Kernel specialized for the dimension actually stored, which can
+        # change when a fabric is reloaded (memoized, so a cheap lookup)
+        pln_kernel = _get_pln_kernel(P.shape[1])
+        if pln_kernel is not None:
+            truth_value, premise_consistency = pln_kernel(
+                P, conclusion_emb.astype(np.float32, copy=False)
+            )
         else:
-            return {'truth_value': 0.0, 'confidence': 0.0}
+            truth_value, premise_consistency = self._pln_numpy(
+                P, scale_emb.norms[premise_ids], conclusion_emb,
+                scale_emb.norms[conclusion_id]
+            )
         
-        # Compute similarity as proxy for truth value
-        truth_value = _cosine_similarity(combined_premise, conclusion_emb)
+        confidence = min(1.0, premise_consistency * (num_premises / 10))
+        
+        return {
+            'truth_value': float(truth_value),
+            'confidence': float(confidence)
+        }
+    
+    @staticmethod
+    def _pln_numpy(P: np.ndarray, premise_norms: np.ndarray,
+                   conclusion_emb: np.ndarray,
+                   norm_conclusion: float) -> Tuple[float, float]:
+        """NumPy fallback for _pln_kernel using cached norms."""
+        num_premises = len(P)
+        
+        # Combine premises (simple average), keeping float32
+        combined_premise = P.mean(axis=0, dtype=np.float32)
+        
+        # Compute similarity as proxy for truth value, reusing the cached norm;
+        # for unit-length stores norm_conclusion is 1
+        norm_premise = np.linalg.norm(combined_premise)
+        denom = max(norm_premise * norm_conclusion, EPS)
         # Normalize to [0, 1]
-        truth_value = (truth_value + 1) / 2
+        truth_value = (float(np.dot(combined_premise, conclusion_emb) / denom) + 1) * 0.5
         
         # Confidence based on number of premises and their consistency
-        premise_consistency = 0.0
-        if len(premise_embeddings) > 1:
-            pair_count = 0
-            for i in range(len(premise_embeddings)):
-                for j in range(i + 1, len(premise_embeddings)):
-                    sim = _cosine_similarity(premise_embeddings[i], premise_embeddings[j])
-                    premise_consistency += (sim + 1) / 2
-                    pair_count += 1
-            
-            if pair_count > 0:
-                premise_consistency /= pair_count
+        if num_premises > 1:
+            # Pairwise cosine similarities via a single matmul
+            S = P @ P.T / np.maximum(np.outer(premise_norms, premise_norms), EPS)
+            iu = np.triu_indices(num_premises, k=1)
+            premise_consistency = float(((S[iu] + 1) * 0.5).mean())
         else:
             premise_consistency = 1.0
         
-        confidence = min(1.0, premise_consistency * (len(premise_embeddings) / 10))
-        
-        return {
-            'truth_value': float(truth_value),
-            'confidence': float(confidence)
-        }
+        return truth_value, premise_consistency
     
     def moses_search_on_fabric(self, target_pattern: np.ndarray,
                               search_scale: str = SkinScale.CELLULAR,
@@ -238,8 +593,8 @@ class FabricIntegrationLayer:
             List of (component_id, fitness_score) tuples
         """
         # Use fabric query to find components matching the pattern
-        results = self.fabric.query_fabric(target_pattern, search_scale, 
-                                          top_k=population_size)
+        results = self._cosine_topk(target_pattern, search_scale,
+                                    k=population_size)
         
         # Fitness is similarity score
         return results
@@ -250,7 +605,12 @@ class FabricIntegrationLayer:
         Use ESN-style temporal prediction anchored in fabric state.
         
         Args:
-            history_states: List of historical fabric states
+            history_states: List of historical fabric states, oldest first.
+                Each maps a scale name to a numeric array for that scale
+                (e.g. the activations array from propagate_signal). A scale
+                is predicted only if every state holds an array of the same
+                shape for it; scales with missing, non-numeric (such as
+                propagate_signal_dict results) or ragged values are skipped.
             prediction_horizon: How many steps ahead to predict
             
         Returns:
@@ -265,22 +625,50 @@ class FabricIntegrationLayer:
         # Simplified: predict next state as weighted average of recent states
         # In a full implementation, this would use ESN reservoir dynamics
         
-        weights = np.exp(-np.arange(len(history_states))[::-1] / 3.0)
-        weights /= weights.sum()
-        
-        # Get embeddings from historical states
-        scale = config['temporal_scale']
+        history_length = len(history_states)
+        weights = self._esn_weight_cache.get(history_length)
+        if weights is None:
+            weights = np.exp(-np.arange(history_length)[::-1] / 3.0)
+            weights /= weights.sum()
+            self._esn_weight_cache[history_length] = weights
+        
+        # Stack each scale's history into a (T, D) matrix and predict with a
+        # single weighted GEMV
+        predicted_activations = {}
+        for scale in config['readout_scales']:
+            H = self._stack_history([state.get(scale) for state in history_states])
+            if H is not None:
+                predicted_activations[scale] = weights @ H
         
         prediction = {
-            'predicted_activations': {},
+            'predicted_activations': predicted_activations,
             'confidence': 0.7,  # Placeholder
             'horizon': prediction_horizon
         }
         
         return prediction
     
+    @staticmethod
+    def _stack_history(values: List[Any]) -> Optional[np.ndarray]:
+        """
+        Stack one scale's history into a (T, ...) float matrix, or return
+        None if any entry is missing, non-numeric or differs in shape.
+        """
+        arrays = []
+        for value in values:
+            if value is None:
+                return None
+            try:
+                array = np.asarray(value, dtype=np.float64)
+            except (TypeError, ValueError):
+                return None
+            if arrays and array.shape != arrays[0].shape:
+                return None
+            arrays.append(array)
+        return np.stack(arrays)
+    
     def ecan_allocate_attention(self, current_activations: Dict[str, np.ndarray],
-                               budget: float = 1.0) -> Dict[str, Dict[int, float]]:
+                               budget: float = 1.0) -> Dict[str, np.ndarray]:
         """
         Allocate attention across fabric components using ECAN principles.
         
@@ -289,44 +677,46 @@ class FabricIntegrationLayer:
             budget: Total attention budget to allocate
             
         Returns:
-            Attention allocation per scale and component
+            Attention allocation per scale, as an array indexed by component ID
         """
         config = self.fabric.cognitive_integrations['ecan']
         
-        allocation = {}
-        total_activation = 0.0
+        # Absolute activations of every scale laid out in one buffer; the
+        # per-scale allocations returned are views into it
+        scale_layout, total_components = self._scale_layout()
+        buffer = np.zeros(total_components)
+        for scale, num_components, offset in scale_layout:
+            if scale in current_activations:
+                activations = np.asarray(current_activations[scale])
+                if activations.shape != (num_components,):
+                    raise ValueError(
+                        f"Expected {num_components} activations at scale {scale}, "
+                        f"got shape {activations.shape}"
+                    )
+                np.abs(activations, out=buffer[offset:offset + num_components])
         
         # Compute total activation across all scales
-        for scale in SkinScale.ALL_SCALES:
-            if scale in current_activations:
-                total_activation += np.sum(np.abs(current_activations[scale]))
+        total_activation = buffer.sum()
         
         if total_activation == 0:
             # Uniform allocation if no activations
-            for scale in SkinScale.ALL_SCALES:
-                scale_emb = self.fabric.scale_embeddings[scale]
-                uniform_attention = budget / sum(
-                    emb.num_components for emb in self.fabric.scale_embeddings.values()
-                )
-                allocation[scale] = {
-                    i: uniform_attention 
-                    for i in range(scale_emb.num_components)
-                }
-        else:
-            # Proportional allocation based on activation
-            for scale in SkinScale.ALL_SCALES:
-                if scale in current_activations:
-                    activations = current_activations[scale]
-                    scale_budget = budget * (np.sum(np.abs(activations)) / total_activation)
-                    
-                    # Normalize activations to allocate scale budget
-                    abs_activations = np.abs(activations)
-                    if abs_activations.sum() > 0:
-                        normalized = abs_activations / abs_activations.sum()
-                        allocation[scale] = {
-                            i: float(scale_budget * normalized[i])
-                            for i in range(len(activations))
-                        }
+            buffer.fill(budget / total_components)
+            return {
+                scale: buffer[offset:offset + num_components]
+                for scale, num_components, offset in scale_layout
+            }
+        
+        # Proportional allocation based on activation: each component gets
+        # budget * |activation| / total, which also splits the budget across
+        # scales in proportion to their total activation
+        buffer *= budget / total_activation
+        scale_sums = np.add.reduceat(buffer, [offset for _, _, offset in scale_layout])
+        allocation = {
+            scale: buffer[offset:offset + num_components]
+            for (scale, num_components, offset), scale_sum
+            in zip(scale_layout, scale_sums)
+            if scale in current_activations and scale_sum > 0
+        }
         
         return allocation
     
@@ -357,7 +747,7 @@ class FabricIntegrationLayer:
             concept = context['concept']
             try:
                 comp_id = self.atomspace_to_fabric(concept)
-                embedding = self.fabric.get_embedding(SkinScale.TISSUE, comp_id)
+                embedding = self.fabric.scale_embeddings[SkinScale.TISSUE]._row_view(comp_id)
                 
                 results['reasoning_steps'].append({
                     'step': 'atomspace_mapping',
@@ -385,6 +775,22 @@ class FabricIntegrationLayer:
                         'step': 'pln_inference',
                         'inference_result': inference
                     })
+                    
+                    # Step 4: Find patterns related to every premise at once
+                    concept_mapping = self.fabric.cognitive_integrations['atomspace']['concept_mapping']
+                    premises = [p for p in context['premises'] if p in concept_mapping]
+                    if premises:
+                        premise_ids = [concept_mapping[p] for p in premises]
+                        queries = self.fabric.scale_embeddings[SkinScale.TISSUE].embeddings[premise_ids]
+                        ids, sims = self.batch_query(queries, SkinScale.TISSUE, top_k=5)
+                        results['reasoning_steps'].append({
+                            'step': 'premise_pattern_search',
+                            'related_components': {
+                                premise: list(zip(row_ids[row_ids >= 0].tolist(),
+                                                  row_sims[row_ids >= 0].tolist()))
+                                for premise, row_ids, row_sims in zip(premises, ids, sims)
+                            }
+                        })
                 
             except Exception as e:
                 results['error'] = str(e)
@@ -392,12 +798,15 @@ class FabricIntegrationLayer:
         return results
 
 
-def create_integrated_platform(embedding_dimension: int = 128) -> Tuple[NeuralFabric, FabricIntegrationLayer]:
+def create_integrated_platform(embedding_dimension: int = 128,
+                               rng: Optional[np.random.Generator] = None
+                               ) -> Tuple[NeuralFabric, FabricIntegrationLayer]:
     """
     Create a complete integrated cognitive platform with neural fabric.
     
     Args:
         embedding_dimension: Dimensionality of embeddings
+        rng: Random generator for fabric initialization
         
     Returns:
         Tuple of (NeuralFabric, FabricIntegrationLayer)
@@ -407,7 +816,7 @@ def create_integrated_platform(embedding_dimension: int = 128) -> Tuple[NeuralFa
     except ImportError:
         from neural_fabric import create_default_fabric
     
-    fabric = create_default_fabric(embedding_dimension)
+    fabric = create_default_fabric(embedding_dimension, rng=rng)
     integration = FabricIntegrationLayer(fabric)
     
     return fabric, integration
@@ -18,28 +18,166 @@ hierarchical relationships and enable cross-scale reasoning.
 
 import numpy as np
 from typing import Dict, List, Tuple, Optional, Any
+import functools
+import itertools
 import json
+import os
 
+try:
+    from numba import njit, prange
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+    prange = range
 
-def _cosine_similarity(vec_a: np.ndarray, vec_b: np.ndarray) -> float:
+try:
+    import orjson
+    HAVE_ORJSON = True
+except ImportError:
+    HAVE_ORJSON = False
+
+
+# Source of embedding versions; unique across all TensorEmbedding instances so
+# a version also identifies the store it came from
+_version_counter = itertools.count()
+
+# Floor for cosine denominators; a zero vector then yields a zero similarity
+# without a data-dependent branch
+EPS = 1e-12
+
+
+# Rows per parallel chunk in _query_numba; each chunk keeps its own top-k
+_QUERY_CHUNK = 256
+
+# Initial value of the top-k buffers in _query_numba: below any cosine, and
+# finite because the kernel is compiled with fastmath (which assumes no infs)
+_NO_MATCH = -2.0
+
+
+def _query_numba(E: np.ndarray, norms: np.ndarray, q: np.ndarray,
+                 top_k: int) -> Tuple[np.ndarray, np.ndarray]:
     """
-    Compute cosine similarity between two vectors.
+    Parallel cosine top-k scan over an embedding matrix.
+    
+    Rows are split into chunks processed in parallel; each chunk keeps a
+    sorted top-k buffer maintained by insertion, and the chunk buffers are
+    merged with a stable sort at the end. Zero similarities are skipped and
+    ties keep the lower component ID. Compiled with numba on first use via
+    _get_query_kernel.
     
     Args:
-        vec_a: First vector
-        vec_b: Second vector
+        E: Embedding matrix of shape (N, D)
+        norms: Cached row norms of shape (N,)
+        q: Query vector of shape (D,)
+        top_k: Number of matches to return
         
     Returns:
-        Cosine similarity value between -1 and 1
+        Tuple of (component_ids, similarities) sorted by descending similarity
+    """
+    n, d = E.shape
+    q_sq = 0.0
+    for j in range(d):
+        q_sq += q[j] * q[j]
+    q_norm = np.sqrt(q_sq)
+    
+    n_chunks = (n + _QUERY_CHUNK - 1) // _QUERY_CHUNK
+    best_ids = np.full((n_chunks, top_k), -1, dtype=np.int64)
+    best_sims = np.full((n_chunks, top_k), _NO_MATCH)
+    
+    for c in prange(n_chunks):
+        for i in range(c * _QUERY_CHUNK, min(n, (c + 1) * _QUERY_CHUNK)):
+            acc = 0.0
+            for j in range(d):
+                acc += E[i, j] * q[j]
+            sim = acc / max(norms[i] * q_norm, EPS)
+            if sim == 0.0 or sim <= best_sims[c, top_k - 1]:
+                continue
+            
+            pos = top_k - 1
+            while pos > 0 and sim > best_sims[c, pos - 1]:
+                best_sims[c, pos] = best_sims[c, pos - 1]
+                best_ids[c, pos] = best_ids[c, pos - 1]
+                pos -= 1
+            best_sims[c, pos] = sim
+            best_ids[c, pos] = i
+    
+    flat_ids = best_ids.ravel()
+    flat_sims = best_sims.ravel()
+    order = np.argsort(-flat_sims, kind='mergesort')[:top_k]
+    order = order[flat_ids[order] >= 0]
+    return flat_ids[order], flat_sims[order]
+
+
+@functools.lru_cache(maxsize=None)
+def _get_query_kernel():
     """
-    norm_a = np.linalg.norm(vec_a)
-    norm_b = np.linalg.norm(vec_b)
+    Compiled _query_numba, or None without numba.
     
-    # Use epsilon comparison for zero norms
-    if norm_a < 1e-10 or norm_b < 1e-10:
-        return 0.0
+    Compilation happens on first call rather than at import, so importing
+    this module stays cheap.
+    """
+    if not HAVE_NUMBA:
+        return None
+    return njit(
+        'Tuple((int64[::1], float64[::1]))(float32[:, ::1], float32[::1], float32[::1], int64)',
+        parallel=True, fastmath=True, cache=True
+    )(_query_numba)
+
+
+def _standard_normal(rng: np.random.Generator, shape: Tuple[int, ...],
+                     dtype: np.dtype) -> np.ndarray:
+    """Draw a C-contiguous standard normal array directly in ``dtype`` where possible."""
+    dtype = np.dtype(dtype)
+    if dtype in (np.float32, np.float64):
+        out = np.empty(shape, dtype=dtype)
+        rng.standard_normal(dtype=dtype, out=out)
+        return out
+    # The generator only fills float32/float64; draw float32 and cast
+    return rng.standard_normal(shape, dtype=np.float32).astype(dtype)
+
+
+def select_top_k(sims: np.ndarray, k: int,
+                 ids: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Top-k selection shared by every similarity search over the fabric.
+    
+    The rules are the same for all callers (and for _query_numba): zero
+    similarities never match, ties keep the lower component ID, and rows
+    with fewer than k matches are padded with ID -1 and similarity 0.0.
+    Each row costs one O(N) partition plus a sort of the k candidates.
+    
+    Args:
+        sims: Similarities of shape (N,) or (Q, N)
+        k: Number of matches per row (clamped to N)
+        ids: Component ID of each column; defaults to the column index
         
-    return float(np.dot(vec_a, vec_b) / (norm_a * norm_b))
+    Returns:
+        Tuple of (component_ids, similarities) of shape (k,) or (Q, k),
+        sorted by descending similarity
+    """
+    sims = np.asarray(sims)
+    rows = np.atleast_2d(sims)
+    n = rows.shape[1]
+    ids = np.arange(n) if ids is None else np.asarray(ids)
+    k = max(0, min(k, n))
+    
+    top_ids = np.full((len(rows), k), -1, dtype=np.intp)
+    top_sims = np.zeros((len(rows), k))
+    if k:
+        ranked = np.where(rows != 0.0, rows, -np.inf)
+        for r, row in enumerate(ranked):
+            # Everything at or above the k-th largest value, so that ties at
+            # the boundary are all considered before the ID tie-break
+            kth = np.partition(row, n - k)[n - k]
+            idx = np.flatnonzero(row >= kth)
+            idx = idx[np.lexsort((ids[idx], -row[idx]))][:k]
+            idx = idx[np.isfinite(row[idx])]
+            top_ids[r, :len(idx)] = ids[idx]
+            top_sims[r, :len(idx)] = rows[r, idx]
+    
+    if sims.ndim == 1:
+        return top_ids[0], top_sims[0]
+    return top_ids, top_sims
 
 
 class SkinScale:
@@ -61,11 +199,19 @@ class TensorEmbedding:
         scale: The scale this embedding represents
         dimension: Dimensionality of the embedding space
         embeddings: The actual tensor values (numpy array)
+        norms: Cached L2 norm of each embedding row
+        unit_embeddings: L2-normalized copy of the embeddings, so cosine
+            similarity against them is a plain dot product
+        version: Changes on every embedding write, for cache invalidation
+        normalized: Whether rows are kept unit-length (cosine == dot product)
         metadata: Additional information about this embedding
     """
     
     def __init__(self, scale: str, dimension: int, num_components: int, 
-                 learning_rate: float = 0.01):
+                 learning_rate: float = 0.01, normalized: bool = False,
+                 dtype: np.dtype = np.float32,
+                 rng: Optional[np.random.Generator] = None,
+                 embeddings: Optional[np.ndarray] = None):
         """
         Initialize a tensor embedding.
         
@@ -74,14 +220,44 @@ class TensorEmbedding:
             dimension: Dimensionality of embedding vectors
             num_components: Number of distinct components at this scale
             learning_rate: Learning rate for gradient-based updates
+            normalized: Keep every row L2-normalized on write
+            dtype: Storage dtype for embeddings (float32 by default, float16
+                to halve memory again)
+            rng: Random generator for initialization (a fresh default_rng
+                if omitted; pass a seeded one for reproducible embeddings)
+            embeddings: Existing (num_components, dimension) matrix to adopt
+                instead of drawing random values (rows are L2-normalized if
+                ``normalized``); rng is then unused
         """
         self.scale = scale
         self.dimension = dimension
         self.num_components = num_components
         self.learning_rate = learning_rate
-        
-        # Initialize embeddings with small random values
-        self.embeddings = np.random.randn(num_components, dimension) * 0.01
+        self.normalized = normalized
+        
+        # Initialize embeddings with small random values, stored as float32
+        # to halve the bytes moved by similarity scans; rows are kept
+        # C-contiguous so row gathers and GEMVs take the fast BLAS path
+        if embeddings is not None:
+            self.embeddings = np.ascontiguousarray(embeddings, dtype=dtype)
+            if self.embeddings.shape != (num_components, dimension):
+                raise ValueError(
+                    f"Embeddings shape {self.embeddings.shape} does not match "
+                    f"({num_components}, {dimension})"
+                )
+        else:
+            rng = rng if rng is not None else np.random.default_rng()
+            self.embeddings = _standard_normal(rng, (num_components, dimension), dtype)
+            self.embeddings *= 0.01
+        assert self.embeddings.flags['C_CONTIGUOUS']
+        if normalized:
+            # Zero rows stay zero, as in _sync_row
+            self.embeddings /= np.maximum(
+                np.linalg.norm(self.embeddings, axis=1, keepdims=True), EPS
+            ).astype(self.embeddings.dtype)
+        
+        # Cached row norms and unit rows, kept in sync with every embedding write
+        self.refresh_norms()
         
         # Gradient accumulator for learning
         self.gradients = np.zeros_like(self.embeddings)
@@ -90,11 +266,34 @@ class TensorEmbedding:
         self.metadata: Dict[int, Dict[str, Any]] = {}
         
     def get_embedding(self, component_id: int) -> np.ndarray:
-        """Retrieve embedding vector for a specific component."""
+        """
+        Retrieve embedding vector for a specific component.
+        
+        Returns a copy that callers may modify freely; internal read-only
+        paths use _row_view instead to skip the allocation.
+        """
+        return self._row_view(component_id).copy()
+    
+    def _row_view(self, component_id: int) -> np.ndarray:
+        """Return the embedding row as a view into storage (no copy); do not modify."""
+        if 0 <= component_id < self.num_components:
+            return self.embeddings[component_id]
+        raise ValueError(f"Component ID {component_id} out of range")
+    
+    def get_unit_embedding(self, component_id: int) -> np.ndarray:
+        """Retrieve the L2-normalized embedding vector for a component."""
         if 0 <= component_id < self.num_components:
-            return self.embeddings[component_id].copy()
+            return self.unit_embeddings[component_id].copy()
         raise ValueError(f"Component ID {component_id} out of range")
     
+    def _check_ids(self, component_ids: np.ndarray) -> np.ndarray:
+        """Return component IDs as an index array, raising ValueError if any is out of range."""
+        component_ids = np.asarray(component_ids, dtype=np.intp)
+        out_of_range = (component_ids < 0) | (component_ids >= self.num_components)
+        if out_of_range.any():
+            raise ValueError(f"Component ID {component_ids[out_of_range][0]} out of range")
+        return component_ids
+    
     def update_embedding(self, component_id: int, gradient: np.ndarray):
         """
         Update embedding using gradient descent.
@@ -105,6 +304,63 @@ class TensorEmbedding:
         """
         if 0 <= component_id < self.num_components:
             self.embeddings[component_id] += gradient
+            self._sync_row(component_id)
+    
+    def update_embeddings(self, component_ids: np.ndarray, gradients: np.ndarray):
+        """
+        Apply gradient updates to many components at once.
+        
+        Args:
+            component_ids: Unique component IDs to update
+            gradients: Gradient matrix of shape (len(component_ids), dimension)
+                (already scaled by learning rate)
+        """
+        self.embeddings[component_ids] += gradients
+        self._sync_rows(component_ids)
+    
+    def set_embedding(self, component_id: int, embedding: np.ndarray):
+        """Overwrite the embedding vector for a specific component."""
+        if 0 <= component_id < self.num_components:
+            self.embeddings[component_id] = embedding
+            self._sync_row(component_id)
+            return
+        raise ValueError(f"Component ID {component_id} out of range")
+    
+    def _sync_row(self, component_id: int):
+        """Refresh the cached norm of a row, renormalizing it if required."""
+        norm = np.linalg.norm(self.embeddings[component_id])
+        if self.normalized and norm > 0:
+            self.embeddings[component_id] /= norm
+            norm = 1.0
+        elif not self.normalized:
+            self.unit_embeddings[component_id] = self.embeddings[component_id] / max(norm, EPS)
+        self.norms[component_id] = norm
+        self.version = next(_version_counter)
+    
+    def _sync_rows(self, component_ids: np.ndarray):
+        """Vectorized _sync_row over a set of unique component IDs."""
+        rows = self.embeddings[component_ids]
+        norms = np.linalg.norm(rows, axis=1)
+        if self.normalized:
+            nonzero = norms > 0
+            rows[nonzero] /= norms[nonzero, None]
+            self.embeddings[component_ids] = rows
+            norms[nonzero] = 1.0
+        else:
+            self.unit_embeddings[component_ids] = rows / np.maximum(norms, EPS)[:, None]
+        self.norms[component_ids] = norms
+        self.version = next(_version_counter)
+    
+    def refresh_norms(self):
+        """Recompute cached norms and unit rows for the whole embedding matrix."""
+        self.embeddings = np.ascontiguousarray(self.embeddings)
+        self.norms = np.linalg.norm(self.embeddings, axis=1)
+        if self.normalized:
+            # Rows are already unit-length; share the storage
+            self.unit_embeddings = self.embeddings
+        else:
+            self.unit_embeddings = self.embeddings / np.maximum(self.norms, EPS)[:, None]
+        self.version = next(_version_counter)
             
     def set_metadata(self, component_id: int, metadata: Dict[str, Any]):
         """Set metadata for a specific component."""
@@ -114,12 +370,17 @@ class TensorEmbedding:
         """Get metadata for a specific component."""
         return self.metadata.get(component_id, {})
     
+    def clear_metadata(self, component_id: int):
+        """Remove metadata for a specific component."""
+        self.metadata.pop(component_id, None)
+    
     def compute_similarity(self, component_a: int, component_b: int) -> float:
         """Compute cosine similarity between two components."""
-        emb_a = self.embeddings[component_a]
-        emb_b = self.embeddings[component_b]
+        emb_a = self._row_view(component_a)
+        emb_b = self._row_view(component_b)
+        denom = max(self.norms[component_a] * self.norms[component_b], EPS)
         
-        return _cosine_similarity(emb_a, emb_b)
+        return float(np.dot(emb_a, emb_b) / denom)
 
 
 class NeuralFabric:
@@ -134,33 +395,53 @@ class NeuralFabric:
     - Integration with cognitive systems (AtomSpace, PLN, MOSES, ESN)
     """
     
-    def __init__(self, embedding_dimension: int = 128):
+    def __init__(self, embedding_dimension: int = 128,
+                 normalize_embeddings: bool = False,
+                 dtype: np.dtype = np.float32,
+                 rng: Optional[np.random.Generator] = None):
         """
         Initialize the neural fabric.
         
         Args:
             embedding_dimension: Dimensionality of embedding vectors across all scales
+            normalize_embeddings: Store unit-length embeddings at every scale
+            dtype: Storage dtype for embeddings and transforms (float32 by
+                default; float16 is accepted as an opt-in)
+            rng: Random generator for embedding and transform initialization
         """
         self.embedding_dimension = embedding_dimension
+        self.normalize_embeddings = normalize_embeddings
+        self.dtype = np.dtype(dtype)
+        self.rng = rng if rng is not None else np.random.default_rng()
         
         # Initialize embeddings at each scale with appropriate component counts
         self.scale_embeddings: Dict[str, TensorEmbedding] = {
             SkinScale.CELLULAR: TensorEmbedding(
-                SkinScale.CELLULAR, embedding_dimension, num_components=1000
+                SkinScale.CELLULAR, embedding_dimension, num_components=1000,
+                normalized=normalize_embeddings, dtype=self.dtype, rng=self.rng
             ),
             SkinScale.TISSUE: TensorEmbedding(
-                SkinScale.TISSUE, embedding_dimension, num_components=50
+                SkinScale.TISSUE, embedding_dimension, num_components=50,
+                normalized=normalize_embeddings, dtype=self.dtype, rng=self.rng
             ),
             SkinScale.REGION: TensorEmbedding(
-                SkinScale.REGION, embedding_dimension, num_components=20
+                SkinScale.REGION, embedding_dimension, num_components=20,
+                normalized=normalize_embeddings, dtype=self.dtype, rng=self.rng
             ),
             SkinScale.SYSTEM: TensorEmbedding(
-                SkinScale.SYSTEM, embedding_dimension, num_components=5
+                SkinScale.SYSTEM, embedding_dimension, num_components=5,
+                normalized=normalize_embeddings, dtype=self.dtype, rng=self.rng
             ),
         }
         
-        # Cross-scale transformation matrices (learnable)
+        # Cross-scale transformation matrices (learnable), plus a dispatch
+        # table indexed by scale position (None on the diagonal and for
+        # transforms flagged as identity)
         self.cross_scale_transforms: Dict[Tuple[str, str], np.ndarray] = {}
+        self._composed_transform_keys: set = set()
+        self._identity_transforms: Dict[Tuple[str, str], bool] = {}
+        self._scale_index = {scale: i for i, scale in enumerate(SkinScale.ALL_SCALES)}
+        self._xf_table: List[List[Optional[np.ndarray]]] = []
         self._initialize_cross_scale_transforms()
         
         # Integration points for cognitive systems
@@ -176,13 +457,65 @@ class NeuralFabric:
                 key_up = (scale_from, scale_to)
                 key_down = (scale_to, scale_from)
                 
-                # Initialize with identity + small noise
-                transform = np.eye(self.embedding_dimension) + \
-                           np.random.randn(self.embedding_dimension, 
-                                         self.embedding_dimension) * 0.01
+                # Initialize with identity + small noise, built in place
+                transform = _standard_normal(
+                    self.rng, (self.embedding_dimension, self.embedding_dimension), self.dtype
+                )
+                transform *= 0.01
+                np.fill_diagonal(transform, transform.diagonal() + 1.0)
                 
-                self.cross_scale_transforms[key_up] = transform.copy()
-                self.cross_scale_transforms[key_down] = transform.T.copy()
+                self.cross_scale_transforms[key_up] = transform
+                self.cross_scale_transforms[key_down] = np.ascontiguousarray(transform.T)
+                assert self.cross_scale_transforms[key_up].flags['C_CONTIGUOUS']
+                assert self.cross_scale_transforms[key_down].flags['C_CONTIGUOUS']
+        
+        self._rebuild_composed_transforms()
+    
+    def _rebuild_composed_transforms(self):
+        """
+        Precompose transforms for scale pairs without a direct transform.
+        
+        Each missing pair is filled with the product of the adjacent-scale
+        transforms along the path between them (identity for missing steps),
+        so transform_across_scales is always a single matrix product. Also
+        rebuilds the scale-indexed dispatch table and re-flags transforms
+        that are within 1e-3 of identity, which are then skipped. Call again
+        after any transform is updated.
+        """
+        scales = SkinScale.ALL_SCALES
+        
+        for key in self._composed_transform_keys:
+            del self.cross_scale_transforms[key]
+        self._composed_transform_keys = set()
+        
+        for from_idx, from_scale in enumerate(scales):
+            for to_idx, to_scale in enumerate(scales):
+                key = (from_scale, to_scale)
+                if from_idx == to_idx or key in self.cross_scale_transforms:
+                    continue
+                
+                composed = np.eye(self.embedding_dimension, dtype=self.dtype)
+                step = 1 if to_idx > from_idx else -1
+                for i in range(from_idx, to_idx, step):
+                    step_key = (scales[i], scales[i + step])
+                    if step_key in self.cross_scale_transforms:
+                        composed = self.cross_scale_transforms[step_key] @ composed
+                
+                self.cross_scale_transforms[key] = composed
+                self._composed_transform_keys.add(key)
+        
+        identity = np.eye(self.embedding_dimension, dtype=self.dtype)
+        self._identity_transforms = {
+            key: np.allclose(transform, identity, atol=1e-3)
+            for key, transform in self.cross_scale_transforms.items()
+        }
+        
+        self._xf_table = [
+            [None if from_scale == to_scale or self._identity_transforms[(from_scale, to_scale)]
+             else self.cross_scale_transforms[(from_scale, to_scale)]
+             for to_scale in scales]
+            for from_scale in scales
+        ]
     
     def get_embedding(self, scale: str, component_id: int) -> np.ndarray:
         """
@@ -200,6 +533,13 @@ class NeuralFabric:
         
         return self.scale_embeddings[scale].get_embedding(component_id)
     
+    def _lookup_transform(self, from_scale: str, to_scale: str) -> Optional[np.ndarray]:
+        """Return the transform for a scale pair from the dispatch table (None if it is identity)."""
+        try:
+            return self._xf_table[self._scale_index[from_scale]][self._scale_index[to_scale]]
+        except KeyError:
+            raise ValueError(f"Unknown scale pair: {from_scale} -> {to_scale}") from None
+    
     def transform_across_scales(self, embedding: np.ndarray, 
                                from_scale: str, to_scale: str) -> np.ndarray:
         """
@@ -211,33 +551,20 @@ class NeuralFabric:
             to_scale: Target scale
             
         Returns:
-            Transformed embedding vector
+            Transformed embedding vector, in the transform dtype
         """
-        if from_scale == to_scale:
-            return embedding.copy()
-        
-        key = (from_scale, to_scale)
-        if key in self.cross_scale_transforms:
-            return self.cross_scale_transforms[key] @ embedding
-        
-        # If direct transform doesn't exist, use intermediate scales
-        # For now, use composition through adjacent scales
-        scales = SkinScale.ALL_SCALES
-        from_idx = scales.index(from_scale)
-        to_idx = scales.index(to_scale)
-        
-        result = embedding.copy()
-        step = 1 if to_idx > from_idx else -1
-        
-        for i in range(from_idx, to_idx, step):
-            current_scale = scales[i]
-            next_scale = scales[i + step]
-            key = (current_scale, next_scale)
-            
-            if key in self.cross_scale_transforms:
-                result = self.cross_scale_transforms[key] @ result
-        
-        return result
+        transform = self._lookup_transform(from_scale, to_scale)
+        if transform is None:
+            # Same scale or identity transform: a copy, in the same dtype
+            # the matrix product would have produced
+            return np.array(embedding, dtype=self.dtype)
+        
+        if embedding.flags.c_contiguous and embedding.dtype == transform.dtype:
+            return transform @ embedding
+        
+        # Match the transform dtype and layout so the product neither
+        # upcasts nor falls off the contiguous BLAS path
+        return transform @ np.ascontiguousarray(embedding, dtype=transform.dtype)
     
     def integrate_cognitive_system(self, system_name: str, 
                                    integration_config: Dict[str, Any]):
@@ -267,21 +594,37 @@ class NeuralFabric:
             raise ValueError(f"Unknown scale: {scale}")
         
         scale_emb = self.scale_embeddings[scale]
-        similarities = []
+        query_embedding = np.asarray(query_embedding)
+        if query_embedding.shape != (scale_emb.dimension,):
+            raise ValueError(
+                f"Query shape {query_embedding.shape} does not match embedding "
+                f"dimension {scale_emb.dimension}"
+            )
+        
+        query_norm = np.linalg.norm(query_embedding)
+        k = min(top_k, scale_emb.num_components)
+        if query_norm < 1e-10 or k <= 0:
+            return []
+        
+        query_kernel = _get_query_kernel()
+        if query_kernel is not None and scale_emb.embeddings.dtype == np.float32:
+            ids, sims = query_kernel(
+                scale_emb.embeddings, scale_emb.norms,
+                np.ascontiguousarray(query_embedding, dtype=np.float32), k
+            )
+            return list(zip(ids.tolist(), sims.tolist()))
         
-        # Compute similarity with all components at this scale
-        for comp_id in range(scale_emb.num_components):
-            comp_emb = scale_emb.embeddings[comp_id]
-            sim = _cosine_similarity(query_embedding, comp_emb)
-            if sim != 0.0:  # Only include non-zero similarities
-                similarities.append((comp_id, sim))
+        # Compute similarity with all components at this scale as one GEMV
+        # of the unit rows against the unit query
+        sims = scale_emb.unit_embeddings @ (query_embedding / query_norm)
         
-        # Sort by similarity and return top k
-        similarities.sort(key=lambda x: x[1], reverse=True)
-        return similarities[:top_k]
+        ids, top_sims = select_top_k(sims, k)
+        matched = ids >= 0
+        return list(zip(ids[matched].tolist(), top_sims[matched].tolist()))
     
     def propagate_signal(self, source_scale: str, source_component: int,
-                        target_scale: str, signal_strength: float = 1.0) -> Dict[int, float]:
+                        target_scale: str, signal_strength: float = 1.0
+                        ) -> Tuple[np.ndarray, np.ndarray]:
         """
         Propagate a signal from one scale to another, computing activation
         at the target scale.
@@ -293,27 +636,59 @@ class NeuralFabric:
             signal_strength: Strength of the signal
             
         Returns:
-            Dictionary mapping target component IDs to activation levels
+            Tuple of (target_component_ids, activations) arrays
         """
-        # Get source embedding
-        source_emb = self.get_embedding(source_scale, source_component)
+        activations = self.propagate_signal_batch(
+            source_scale, np.array([source_component]), target_scale, signal_strength
+        )[0]
         
-        # Transform to target scale
-        target_emb = self.transform_across_scales(source_emb, source_scale, target_scale)
+        return np.arange(len(activations)), activations
+    
+    def propagate_signal_dict(self, source_scale: str, source_component: int,
+                              target_scale: str, signal_strength: float = 1.0) -> Dict[int, float]:
+        """
+        Propagate a signal like propagate_signal, returning a dictionary
+        mapping target component IDs to activation levels.
+        """
+        ids, activations = self.propagate_signal(
+            source_scale, source_component, target_scale, signal_strength
+        )
+        return dict(zip(ids.tolist(), activations.tolist()))
+    
+    def propagate_signal_batch(self, source_scale: str, source_ids: np.ndarray,
+                               target_scale: str, signal_strength: float = 1.0) -> np.ndarray:
+        """
+        Propagate signals from many source components at once.
         
-        # Compute activations at target scale
-        activations = {}
-        target_scale_emb = self.scale_embeddings[target_scale]
+        The source rows are transformed and matched against the target scale
+        with two matrix-matrix products instead of one GEMV per source.
         
-        for comp_id in range(target_scale_emb.num_components):
-            comp_emb = target_scale_emb.embeddings[comp_id]
+        Args:
+            source_scale: Scale of the sources
+            source_ids: Component IDs at source scale
+            target_scale: Scale to propagate to
+            signal_strength: Strength of the signal
             
-            # Compute activation as scaled similarity
-            similarity = _cosine_similarity(target_emb, comp_emb)
-            activation = signal_strength * similarity
-            activations[comp_id] = float(activation)
-        
-        return activations
+        Returns:
+            Activation matrix of shape (len(source_ids), num_target_components)
+        """
+        for scale in (source_scale, target_scale):
+            if scale not in self.scale_embeddings:
+                raise ValueError(f"Unknown scale: {scale}")
+        
+        source_emb = self.scale_embeddings[source_scale]
+        source_ids = source_emb._check_ids(source_ids)
+        
+        # Gather source rows and transform them to the target scale
+        src = source_emb.embeddings[source_ids]
+        transform = self._lookup_transform(source_scale, target_scale)
+        tgt = src if transform is None else src @ transform.T
+        
+        # Normalize the transformed rows, then score them against the unit
+        # rows of the target scale
+        tgt = tgt / np.maximum(np.linalg.norm(tgt, axis=1), EPS)[:, None]
+        target_unit = self.scale_embeddings[target_scale].unit_embeddings
+        return signal_strength * (tgt @ target_unit.T)
     
     def update_from_observation(self, scale: str, component_id: int,
                                observation: np.ndarray, learning_rate: float = 0.01):
@@ -326,22 +701,46 @@ class NeuralFabric:
             observation: Observation vector
             learning_rate: Learning rate for update
         """
+        self.update_from_observation_batch(
+            scale, np.array([component_id]), np.asarray(observation)[None, :], learning_rate
+        )
+    
+    def update_from_observation_batch(self, scale: str, component_ids: np.ndarray,
+                                      observations: np.ndarray, learning_rate: float = 0.01):
+        """
+        Update many fabric embeddings from observations in one vectorized step.
+        
+        Args:
+            scale: Scale of the observations
+            component_ids: Unique component IDs being observed
+            observations: Observation matrix of shape (len(component_ids), dimension)
+            learning_rate: Learning rate for update
+        """
         if scale not in self.scale_embeddings:
             raise ValueError(f"Unknown scale: {scale}")
         
         scale_emb = self.scale_embeddings[scale]
-        current_emb = scale_emb.get_embedding(component_id)
-        
-        # Compute gradient (direction towards observation)
-        gradient = observation - current_emb
+        component_ids = scale_emb._check_ids(component_ids)
         
-        # Update embedding (move towards observation)
-        scale_emb.update_embedding(component_id, learning_rate * gradient)
+        # Move each embedding towards its observation; norms and unit rows
+        # of the updated components are refreshed together
+        current = scale_emb.embeddings[component_ids]
+        scale_emb.update_embeddings(component_ids, learning_rate * (observations - current))
     
     def save_fabric(self, filepath: str):
-        """Save the neural fabric to disk."""
+        """
+        Save the neural fabric to disk.
+        
+        Configuration and metadata are written as JSON to ``filepath``; the
+        embedding and transform matrices go to a sibling ``.npz`` archive
+        that the JSON references by array name.
+        """
+        arrays_path = os.path.splitext(filepath)[0] + '.npz'
+        arrays: Dict[str, np.ndarray] = {}
         fabric_data = {
             'embedding_dimension': self.embedding_dimension,
+            'normalize_embeddings': self.normalize_embeddings,
+            'arrays_file': os.path.basename(arrays_path),
             'scale_embeddings': {},
             'cross_scale_transforms': {},
             'cognitive_integrations': self.cognitive_integrations
@@ -349,45 +748,89 @@ class NeuralFabric:
         
         # Save embeddings
         for scale, emb in self.scale_embeddings.items():
+            name = f"emb_{scale}"
+            arrays[name] = emb.embeddings
             fabric_data['scale_embeddings'][scale] = {
-                'embeddings': emb.embeddings.tolist(),
+                'embeddings': name,
                 'metadata': emb.metadata
             }
         
-        # Save transforms
+        # Save transforms; precomposed ones are rebuilt on load
         for key, transform in self.cross_scale_transforms.items():
-            fabric_data['cross_scale_transforms'][f"{key[0]}->{key[1]}"] = \
-                transform.tolist()
-        
-        with open(filepath, 'w') as f:
-            json.dump(fabric_data, f, indent=2)
+            if key in self._composed_transform_keys:
+                continue
+            name = f"xf_{key[0]}_{key[1]}"
+            arrays[name] = transform
+            fabric_data['cross_scale_transforms'][f"{key[0]}->{key[1]}"] = name
+        
+        np.savez_compressed(arrays_path, **arrays)
+        if HAVE_ORJSON:
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(
+                    fabric_data,
+                    option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+                ))
+        else:
+            with open(filepath, 'w') as f:
+                json.dump(fabric_data, f)
     
     def load_fabric(self, filepath: str):
-        """Load the neural fabric from disk."""
-        with open(filepath, 'r') as f:
-            fabric_data = json.load(f)
+        """
+        Load the neural fabric from disk.
+        
+        Reads the layout written by save_fabric, as well as older files that
+        hold the matrices inline as JSON lists.
+        """
+        if HAVE_ORJSON:
+            with open(filepath, 'rb') as f:
+                fabric_data = orjson.loads(f.read())
+        else:
+            with open(filepath, 'r') as f:
+                fabric_data = json.load(f)
+        
+        arrays: Dict[str, np.ndarray] = {}
+        if 'arrays_file' in fabric_data:
+            arrays_path = os.path.join(os.path.dirname(filepath), fabric_data['arrays_file'])
+            with np.load(arrays_path) as archive:
+                arrays = {name: archive[name] for name in archive.files}
+        
+        def _array(value: Any) -> np.ndarray:
+            # Array name in the .npz archive, or an inline JSON list
+            return arrays[value] if isinstance(value, str) else np.array(value)
         
         self.embedding_dimension = fabric_data['embedding_dimension']
+        # Files written before the flag was saved keep this fabric's setting
+        self.normalize_embeddings = fabric_data.get(
+            'normalize_embeddings', self.normalize_embeddings
+        )
         
         # Load embeddings
         for scale, data in fabric_data['scale_embeddings'].items():
-            emb_array = np.array(data['embeddings'])
+            emb_array = np.ascontiguousarray(_array(data['embeddings']), dtype=self.dtype)
             num_components, dimension = emb_array.shape
             
+            # Adopt the stored matrix directly; no random draw to discard
             self.scale_embeddings[scale] = TensorEmbedding(
-                scale, dimension, num_components
+                scale, dimension, num_components,
+                normalized=self.normalize_embeddings, dtype=self.dtype,
+                embeddings=emb_array
             )
-            self.scale_embeddings[scale].embeddings = emb_array
-            self.scale_embeddings[scale].metadata = data['metadata']
-        
-        # Load transforms
-        for key_str, transform_list in fabric_data['cross_scale_transforms'].items():
+            for component_id, metadata in data['metadata'].items():
+                # JSON object keys are strings; restore integer component IDs
+                self.scale_embeddings[scale].set_metadata(int(component_id), metadata)
+        
+        # Load transforms, replacing the current set
+        self.cross_scale_transforms = {}
+        self._composed_transform_keys = set()
+        for key_str, transform_value in fabric_data['cross_scale_transforms'].items():
             # Validate key format
             if '->' not in key_str or key_str.count('->') != 1:
                 raise ValueError(f"Invalid transform key format: {key_str}. Expected 'from_scale->to_scale'")
             from_scale, to_scale = key_str.split('->')
             self.cross_scale_transforms[(from_scale, to_scale)] = \
-                np.array(transform_list)
+                np.ascontiguousarray(_array(transform_value), dtype=self.dtype)
+        
+        self._rebuild_composed_transforms()
         
         self.cognitive_integrations = fabric_data['cognitive_integrations']
     
@@ -405,30 +848,30 @@ class NeuralFabric:
         }
         
         for scale, emb in self.scale_embeddings.items():
+            # Row norms are cached and kept in sync on every write
+            norms = emb.norms
             state['scales'][scale] = {
                 'num_components': emb.num_components,
-                'embedding_norm_mean': float(np.mean(np.linalg.norm(
-                    emb.embeddings, axis=1
-                ))),
-                'embedding_norm_std': float(np.std(np.linalg.norm(
-                    emb.embeddings, axis=1
-                )))
+                'embedding_norm_mean': float(norms.mean()),
+                'embedding_norm_std': float(norms.std())
             }
         
         return state
 
 
-def create_default_fabric(embedding_dimension: int = 128) -> NeuralFabric:
+def create_default_fabric(embedding_dimension: int = 128,
+                          rng: Optional[np.random.Generator] = None) -> NeuralFabric:
     """
     Create a neural fabric with default configuration.
     
     Args:
         embedding_dimension: Dimensionality of embeddings
+        rng: Random generator for initialization (seed it for reproducibility)
         
     Returns:
         Initialized NeuralFabric instance
     """
-    fabric = NeuralFabric(embedding_dimension)
+    fabric = NeuralFabric(embedding_dimension, rng=rng)
     
     # Initialize with basic skin component metadata
     _initialize_default_metadata(fabric)